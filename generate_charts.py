@@ -23,24 +23,64 @@ Outputs to:
   ./output/charts/users/
 
 Requirements:
-  pip install pandas matplotlib
+  pip install pandas pyarrow matplotlib
 """
 
+import csv
+import hashlib
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import random
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 # -------------------------
 # Output folders
 # -------------------------
 CHART_DIR = Path("output/charts")
 USER_CHART_DIR = CHART_DIR / "users"
-CHART_DIR.mkdir(parents=True, exist_ok=True)
-USER_CHART_DIR.mkdir(parents=True, exist_ok=True)
+
+# Resolution for every saved PNG (matplotlib default is 100)
+CHART_DPI = 90
+
+NS_PER_DAY = 86_400_000_000_000
+
+_PLT = None
+
+def _plt():
+    # matplotlib is only imported once a chart actually renders
+    global _PLT
+    if _PLT is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _PLT = plt
+    return _PLT
+
+def _save_png(fig, path):
+    # Encode the Agg buffer with Pillow at a fast zlib level instead of savefig
+    from PIL import Image
+    fig.set_dpi(CHART_DPI)
+    fig.canvas.draw()
+    Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(path, compress_level=1)
+
+# Parsed CSVs are cached here as parquet for warm re-runs; bump the version
+# whenever parse options change so stale entries are not reused
+CACHE_DIR = Path("output/_cache")
+CACHE_VERSION = 2
+
+# Only the columns the charts read are parsed; id and label columns are
+# declared as strings up front, numbers and timestamps are coerced per chart
+STRING = pd.ArrowDtype(pa.string())
+
+# pandas' default NA markers, so the Arrow parser nulls the same cells
+NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
 
 # Candidate CSV paths
 CANDIDATE_CSVS = {
@@ -50,212 +90,393 @@ CANDIDATE_CSVS = {
     "users": [Path("output/users.csv"), Path("/mnt/data/output/users.csv")],
 }
 
-def try_read(candidates):
+def csv_columns(p, usecols):
+    # The wanted columns this CSV has, or None if it has no header row
+    with open(p, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        return None
+    return [c for c in usecols if c in header]
+
+
+def parse_csv(p, usecols=None, dtype=None):
+    # dtype maps columns to pd.ArrowDtype so both parsers skip type inference
+    if usecols is not None and not usecols:
+        # Arrow reads include_columns=[] as "all columns"; pandas as none
+        return pd.DataFrame()
+    try:
+        # Multi-threaded Arrow parse, strings stay Arrow-backed
+        column_types = {col: t.pyarrow_dtype for col, t in (dtype or {}).items()}
+        table = pacsv.read_csv(
+            p,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=usecols or [],
+                column_types=column_types,
+                null_values=NULL_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    except Exception as e:
+        print(f"Arrow parse of {p} failed ({e}), retrying with pandas")
+    try:
+        df = pd.read_csv(p, usecols=usecols, dtype=dtype, dtype_backend="pyarrow")
+        # Match the Arrow path's column order
+        return df[usecols] if usecols else df
+    except Exception as e:
+        print(f"Found {p} but failed to read: {e}")
+    return None
+
+
+def cache_path(p, cols, dtype):
+    # One parquet file per resolved source path and column/dtype spec, so
+    # same-named CSVs in different folders never share an entry
+    spec = repr((CACHE_VERSION, str(p.resolve()), cols, sorted((c, str(t)) for c, t in (dtype or {}).items())))
+    digest = hashlib.sha1(spec.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{p.stem}-{digest}.parquet"
+
+
+def try_read(candidates, usecols=None, dtype=None, optional=()):
+    # Columns in usecols but not in optional are required; a CSV without
+    # them is skipped like an unreadable one
     for p in candidates:
         if p.exists():
+            cols = None
+            if usecols is not None:
+                try:
+                    cols = csv_columns(p, usecols)
+                except Exception as e:
+                    print(f"Found {p} but failed to read: {e}")
+                    continue
+                if cols is None:
+                    print(f"Found {p} but it has no header row")
+                    continue
+                missing = [c for c in usecols if c not in cols and c not in optional]
+                if missing:
+                    print(f"Found {p} but it is missing columns {missing}")
+                    continue
+            if cols == []:
+                print(f"Loaded: {p} (none of {usecols} present)")
+                return pd.DataFrame()
+
+            # Reuse the parquet copy of this CSV unless the CSV is newer
+            cache = cache_path(p, cols, dtype)
+            if cache.exists() and cache.stat().st_mtime >= p.stat().st_mtime:
+                try:
+                    df = pd.read_parquet(cache, columns=cols, dtype_backend="pyarrow")
+                    df = df.astype({c: t for c, t in (dtype or {}).items() if c in df.columns})
+                    print(f"Loaded: {p} (cached)")
+                    return df
+                except Exception as e:
+                    print(f"Ignoring unreadable cache {cache}: {e}")
+
+            df = parse_csv(p, cols, dtype)
+            if df is None:
+                continue
+            print(f"Loaded: {p}")
             try:
-                print(f"Loaded: {p}")
-                return pd.read_csv(p)
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(cache, compression="zstd", index=False)
             except Exception as e:
-                print(f"Found {p} but failed to read: {e}")
+                print(f"Could not cache {p}: {e}")
+            return df
     return None
 
 
-# -------------------------
-# Load CSVs if exist
-# -------------------------
-ingredients_df = try_read(CANDIDATE_CSVS["ingredients"])
-recipe_df = try_read(CANDIDATE_CSVS["recipe"])
-inter_df = try_read(CANDIDATE_CSVS["interactions"])
-users_df = try_read(CANDIDATE_CSVS["users"])
-
-used_synthetic = False
-
 # -------------------------
 # Synthetic fallback dataset
 # -------------------------
-if ingredients_df is None or recipe_df is None or inter_df is None:
-    used_synthetic = True
-    print("Synthesizing fallback dataset...")
-
+def synthetic_dataset():
     sample_recipes = [
         "recipe_puran_poli","recipe_pasta_alfredo","recipe_veg_biryani",
         "recipe_aloo_paratha","recipe_egg_fried_rice","recipe_paneer_butter_masala"
     ]
 
-    recipe_rows = []
-    ing_rows = []
-    inter_rows = []
-    for rid in sample_recipes:
-        prep = random.randint(10,40)
-        cook = random.randint(10,60)
-        recipe_rows.append({
-            "recipe_id": rid,
-            "name": rid.replace("recipe_","").replace("_"," ").title(),
-            "prep_time_min": prep,
-            "cook_time_min": cook,
-            "total_time_min": prep + cook,
-            "difficulty": random.choice(["easy","medium","hard"])
-        })
-        for i in range(5):
-            ing_rows.append({
-                "recipe_id": rid,
-                "ingredient_id": f"{rid}_ing{i+1}",
-                "name": random.choice(["onion","garlic","salt","oil","turmeric"]),
-                "quantity": random.choice([1,2,3]),
-                "unit": "unit",
-                "order": i+1
-            })
-
-    for i in range(100):
-        rid = random.choice(sample_recipes)
-        t = random.choice(["view","like","cook_attempt","rating"])
-        inter_rows.append({
-            "interaction_id": f"int_{i}",
-            "user_id": f"user{random.randint(1,10)}",
-            "recipe_id": rid,
-            "type": t,
-            "rating": random.choice([None,3,4,5]) if t=="rating" else ""
-        })
-
-    recipe_df = pd.DataFrame(recipe_rows)
-    ingredients_df = pd.DataFrame(ing_rows)
-    inter_df = pd.DataFrame(inter_rows)
+    # Whole columns per draw instead of per-row dicts
+    rng = np.random.default_rng(0)
+    n_recipes = len(sample_recipes)
+
+    prep = rng.integers(10, 41, size=n_recipes)
+    cook = rng.integers(10, 61, size=n_recipes)
+    recipe_df = pd.DataFrame({
+        "recipe_id": sample_recipes,
+        "name": [rid.replace("recipe_","").replace("_"," ").title() for rid in sample_recipes],
+        "prep_time_min": prep,
+        "cook_time_min": cook,
+        "total_time_min": prep + cook,
+        "difficulty": rng.choice(["easy","medium","hard"], size=n_recipes)
+    })
+
+    ing_per_recipe = 5
+    n_ing = n_recipes * ing_per_recipe
+    ing_recipe = np.repeat(sample_recipes, ing_per_recipe)
+    ing_order = np.tile(np.arange(1, ing_per_recipe + 1), n_recipes)
+    ingredients_df = pd.DataFrame({
+        "recipe_id": ing_recipe,
+        "ingredient_id": np.char.add(np.char.add(ing_recipe, "_ing"), ing_order.astype(str)),
+        "name": rng.choice(["onion","garlic","salt","oil","turmeric"], size=n_ing),
+        "quantity": rng.choice([1,2,3], size=n_ing),
+        "unit": "unit",
+        "order": ing_order
+    })
+
+    n_inter = 100
+    inter_type = rng.choice(["view","like","cook_attempt","rating"], size=n_inter)
+    inter_df = pd.DataFrame({
+        "interaction_id": np.char.add("int_", np.arange(n_inter).astype(str)),
+        "user_id": np.char.add("user", rng.integers(1, 11, size=n_inter).astype(str)),
+        "recipe_id": rng.choice(sample_recipes, size=n_inter),
+        "type": inter_type,
+        "rating": np.where(inter_type=="rating", rng.choice([np.nan,3,4,5], size=n_inter), np.nan)
+    })
+
+    return recipe_df, ingredients_df, inter_df
+
+
+def top_n(counts, n=20):
+    # Indices of the n largest counts, largest first, ties in input order.
+    # argpartition only finds the cutoff value in O(len); everything at or
+    # above it is then stable-sorted, so ties at the cutoff match a full sort.
+    if counts.size <= n:
+        return np.argsort(-counts, kind="stable")
+    kth = counts[np.argpartition(counts, -n)[-n]]
+    cand = np.flatnonzero(counts >= kth)
+    return cand[np.argsort(-counts[cand], kind="stable")][:n]
+
 
 # ------------------------------
 # CHART 1 — TOP INGREDIENTS
 # ------------------------------
-top_ing = ingredients_df["name"].astype(str).str.strip().value_counts().reset_index()
-top_ing.columns = ["ingredient", "count"]
-top_ing = top_ing.head(20)
-
-fig1, ax1 = plt.subplots(figsize=(10,6))
-ax1.bar(top_ing["ingredient"], top_ing["count"])
-ax1.set_title("Top Ingredients (by occurrence)")
-ax1.set_xlabel("Ingredient")
-ax1.set_ylabel("Count")
-plt.xticks(rotation=45, ha="right")
-plt.tight_layout()
-fig1.savefig(CHART_DIR / "top_ingredients.png")
-plt.close(fig1)
-
-top_ing.to_csv(CHART_DIR / "top_ingredients_preview.csv", index=False)
+def render_top_ingredients(ingredients_df):
+    plt = _plt()
+    # Count integer category codes with bincount instead of hashing strings
+    names = ingredients_df["name"].astype("string").str.strip().astype("category")
+    codes = names.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(names.cat.categories))
+    order = top_n(counts)
+    top_ing = pd.DataFrame({"ingredient": names.cat.categories[order], "count": counts[order]})
+
+    fig1, ax1 = plt.subplots(figsize=(10,6))
+    ax1.bar(top_ing["ingredient"], top_ing["count"])
+    ax1.set_title("Top Ingredients (by occurrence)")
+    ax1.set_xlabel("Ingredient")
+    ax1.set_ylabel("Count")
+    plt.xticks(rotation=45, ha="right")
+    plt.tight_layout()
+    _save_png(fig1, CHART_DIR / "top_ingredients.png")
+    plt.close(fig1)
+
+    top_ing.to_csv(CHART_DIR / "top_ingredients_preview.csv", index=False)
 
 
 # ------------------------------
 # CHART 2 — PREP TIME HISTOGRAM
 # ------------------------------
-prep_series = pd.to_numeric(recipe_df["prep_time_min"], errors="coerce").dropna()
+def render_prep_time_histogram(recipe_df):
+    plt = _plt()
+    prep_series = pd.to_numeric(recipe_df["prep_time_min"], errors="coerce").astype("float64").dropna()
 
-fig2, ax2 = plt.subplots(figsize=(8,5))
-ax2.hist(prep_series, bins=10)
-ax2.set_title("Preparation Time Distribution")
-ax2.set_xlabel("Prep Time (min)")
-ax2.set_ylabel("Number of Recipes")
-plt.tight_layout()
-fig2.savefig(CHART_DIR / "prep_time_histogram.png")
-plt.close(fig2)
+    fig2, ax2 = plt.subplots(figsize=(8,5))
+    ax2.hist(prep_series, bins=10)
+    ax2.set_title("Preparation Time Distribution")
+    ax2.set_xlabel("Prep Time (min)")
+    ax2.set_ylabel("Number of Recipes")
+    plt.tight_layout()
+    _save_png(fig2, CHART_DIR / "prep_time_histogram.png")
+    plt.close(fig2)
 
 
 # ------------------------------
 # CHART 3 — PREP TIME VS LIKES
 # ------------------------------
-likes = inter_df[inter_df["type"]=="like"].groupby("recipe_id").size().reset_index(name="like_count")
-
-prep_likes = recipe_df.merge(likes, on="recipe_id", how="left").fillna(0)
-prep_likes["prep_time_min"] = pd.to_numeric(prep_likes["prep_time_min"], errors="coerce").fillna(0)
-
-fig3, ax3 = plt.subplots(figsize=(8,6))
-ax3.scatter(prep_likes["prep_time_min"], prep_likes["like_count"])
-ax3.set_title("Prep Time vs Like Count")
-ax3.set_xlabel("Prep Time (min)")
-ax3.set_ylabel("Likes")
-plt.tight_layout()
-fig3.savefig(CHART_DIR / "prep_vs_likes_scatter.png")
-plt.close(fig3)
+def render_prep_vs_likes(recipe_df, inter_df):
+    plt = _plt()
+    # Align like counts onto recipes by index instead of merging frames
+    rid = inter_df["recipe_id"].to_numpy()
+    is_like = (inter_df["type"]=="like").fillna(False).to_numpy(dtype=bool) & inter_df["recipe_id"].notna().to_numpy()
+    uniq, cnt = np.unique(rid[is_like], return_counts=True)
+    likes = pd.Series(cnt, index=uniq, name="like_count")
+    prep = pd.to_numeric(recipe_df.set_index("recipe_id")["prep_time_min"], errors="coerce").astype("float64").fillna(0)
+    like_count = likes.reindex(prep.index, fill_value=0)
+
+    fig3, ax3 = plt.subplots(figsize=(8,6))
+    ax3.scatter(prep.to_numpy(), like_count.to_numpy(), s=8, rasterized=True)
+    ax3.set_title("Prep Time vs Like Count")
+    ax3.set_xlabel("Prep Time (min)")
+    ax3.set_ylabel("Likes")
+    plt.tight_layout()
+    _save_png(fig3, CHART_DIR / "prep_vs_likes_scatter.png")
+    plt.close(fig3)
 
 
 # =========================================================
 #               USER ANALYTICS (NEW SECTION)
 # =========================================================
 
-if users_df is not None:
-
-    # --------------------------------------
-    # USERS 1: Users by Country
-    # --------------------------------------
-    if "country" in users_df.columns:
-        country_counts = users_df["country"].fillna("unknown").astype(str).value_counts()
-        fig_u1, ax_u1 = plt.subplots(figsize=(8,5))
-        country_counts.plot(kind="bar", ax=ax_u1)
-        ax_u1.set_title("Users by Country")
-        ax_u1.set_xlabel("Country")
-        ax_u1.set_ylabel("User Count")
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-        fig_u1.savefig(USER_CHART_DIR / "users_by_country.png")
-        plt.close(fig_u1)
-
-    # --------------------------------------
-    # USERS 2: Top Users by Interactions
-    # --------------------------------------
-    if "user_id" in inter_df.columns:
-        top_users = inter_df["user_id"].fillna("unknown").value_counts().head(20)
-        fig_u2, ax_u2 = plt.subplots(figsize=(8,6))
-        top_users.plot(kind="barh", ax=ax_u2)
-        ax_u2.set_title("Top Users by Interaction Count")
-        ax_u2.set_xlabel("Interactions")
-        ax_u2.set_ylabel("User ID")
-        plt.tight_layout()
-        fig_u2.savefig(USER_CHART_DIR / "top_users_by_interactions.png")
-        plt.close(fig_u2)
-
-    # --------------------------------------
-    # USERS 3: Interactions per Day (if timestamps exist)
-    # --------------------------------------
-    if "created_at" in inter_df.columns:
-        try:
-            inter_df["created_at_parsed"] = pd.to_datetime(inter_df["created_at"], errors="coerce")
-            df_time = inter_df.dropna(subset=["created_at_parsed"])
-            if not df_time.empty:
-                df_time["date"] = df_time["created_at_parsed"].dt.date
-                daily = df_time.groupby("date").size()
-
-                fig_u3, ax_u3 = plt.subplots(figsize=(10,5))
-                daily.plot(ax=ax_u3)
-                ax_u3.set_title("Interactions Per Day")
-                ax_u3.set_xlabel("Date")
-                ax_u3.set_ylabel("Interactions")
-                plt.xticks(rotation=45, ha="right")
-                plt.tight_layout()
-                fig_u3.savefig(USER_CHART_DIR / "interactions_per_day.png")
-                plt.close(fig_u3)
-        except:
-            pass
+# --------------------------------------
+# USERS 1: Users by Country
+# --------------------------------------
+def render_users_by_country(users_df):
+    plt = _plt()
+    country_counts = users_df["country"].fillna("unknown").astype(str).value_counts()
+    fig_u1, ax_u1 = plt.subplots(figsize=(8,5))
+    country_counts.plot(kind="bar", ax=ax_u1)
+    ax_u1.set_title("Users by Country")
+    ax_u1.set_xlabel("Country")
+    ax_u1.set_ylabel("User Count")
+    plt.xticks(rotation=45, ha="right")
+    plt.tight_layout()
+    _save_png(fig_u1, USER_CHART_DIR / "users_by_country.png")
+    plt.close(fig_u1)
+
+
+# --------------------------------------
+# USERS 2: Top Users by Interactions
+# --------------------------------------
+def render_top_users(inter_df):
+    plt = _plt()
+    # Count with Arrow's hash kernel; only the 20-row result goes to pandas
+    user_ids = pc.fill_null(pa.array(inter_df["user_id"], from_pandas=True), "unknown")
+    vc = pc.value_counts(user_ids)
+    counts = vc.field("counts").to_numpy()
+    order = top_n(counts)
+    top_users = pd.Series(
+        counts[order],
+        index=pd.Index(vc.field("values").take(order).to_pylist(), name="user_id"),
+        name="count",
+    )
+    fig_u2, ax_u2 = plt.subplots(figsize=(8,6))
+    top_users.plot(kind="barh", ax=ax_u2)
+    ax_u2.set_title("Top Users by Interaction Count")
+    ax_u2.set_xlabel("Interactions")
+    ax_u2.set_ylabel("User ID")
+    plt.tight_layout()
+    _save_png(fig_u2, USER_CHART_DIR / "top_users_by_interactions.png")
+    plt.close(fig_u2)
+
+
+# --------------------------------------
+# USERS 3: Interactions per Day (if timestamps exist)
+# --------------------------------------
+def render_interactions_per_day(inter_df):
+    plt = _plt()
+    try:
+        # Day index = int64 nanoseconds // ns-per-day, counted with np.unique
+        created = pd.to_datetime(inter_df["created_at"], errors="coerce", utc=True)
+        ns = created.to_numpy(dtype="datetime64[ns]").view("int64")
+        ns = ns[ns != np.iinfo(np.int64).min]
+        if ns.size:
+            uniq, cnt = np.unique(ns // NS_PER_DAY, return_counts=True)
+            daily = pd.Series(cnt, index=pd.to_datetime(uniq, unit="D"))
+
+            fig_u3, ax_u3 = plt.subplots(figsize=(10,5))
+            daily.plot(ax=ax_u3)
+            ax_u3.set_title("Interactions Per Day")
+            ax_u3.set_xlabel("Date")
+            ax_u3.set_ylabel("Interactions")
+            plt.xticks(rotation=45, ha="right")
+            plt.tight_layout()
+            _save_png(fig_u3, USER_CHART_DIR / "interactions_per_day.png")
+            plt.close(fig_u3)
+    except:
+        pass
+
+
+def _render(task):
+    fn, args = task
+    fn(*args)
+
+
+def main():
+    CHART_DIR.mkdir(parents=True, exist_ok=True)
+    USER_CHART_DIR.mkdir(parents=True, exist_ok=True)
+
+    # -------------------------
+    # Load CSVs if exist
+    # -------------------------
+    ingredients_df = try_read(
+        CANDIDATE_CSVS["ingredients"],
+        usecols=["name"],
+        dtype={"name": STRING},
+    )
+    recipe_df = try_read(
+        CANDIDATE_CSVS["recipe"],
+        usecols=["recipe_id", "prep_time_min"],
+        dtype={"recipe_id": STRING},
+    )
+    inter_df = try_read(
+        CANDIDATE_CSVS["interactions"],
+        usecols=["recipe_id", "type", "user_id", "created_at"],
+        dtype={
+            "recipe_id": STRING,
+            "type": STRING,
+            "user_id": STRING,
+        },
+        optional=["user_id", "created_at"],
+    )
+    users_df = try_read(
+        CANDIDATE_CSVS["users"],
+        usecols=["country"],
+        dtype={"country": STRING},
+        optional=["country"],
+    )
+
+    used_synthetic = False
+    if ingredients_df is None or recipe_df is None or inter_df is None:
+        used_synthetic = True
+        print("Synthesizing fallback dataset...")
+        recipe_df, ingredients_df, inter_df = synthetic_dataset()
+
+    # ------------------------------
+    # RENDER CHARTS
+    # ------------------------------
+    # Charts are independent once the data is loaded, so each one renders in
+    # its own worker process (Agg is not thread-safe). Workers only receive
+    # the columns their chart reads. Frames go through the executor's normal
+    # pickling: ArrowDtype columns pickle as their Arrow buffers, which is
+    # cheaper than a parquet encode/decode round trip per task.
+    tasks = [
+        (render_top_ingredients, (ingredients_df[["name"]],)),
+        (render_prep_time_histogram, (recipe_df[["prep_time_min"]],)),
+        (render_prep_vs_likes, (recipe_df[["recipe_id", "prep_time_min"]], inter_df[["recipe_id", "type"]])),
+    ]
 
+    if users_df is not None:
+        if "country" in users_df.columns:
+            tasks.append((render_users_by_country, (users_df[["country"]],)))
+        if "user_id" in inter_df.columns:
+            tasks.append((render_top_users, (inter_df[["user_id"]],)))
+        if "created_at" in inter_df.columns:
+            tasks.append((render_interactions_per_day, (inter_df[["created_at"]],)))
 
-# ------------------------------
-# README FILE FOR CHARTS
-# ------------------------------
-readme = []
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as ex:
+        list(ex.map(_render, tasks))
+
+    # ------------------------------
+    # README FILE FOR CHARTS
+    # ------------------------------
+    if used_synthetic:
+        note = "NOTE: Missing CSVs — synthetic fallback data used for demo charts."
+    else:
+        note = "Charts generated from ETL CSV files in /output/"
+
+    readme_text = f"""{note}
+
+Recipe Charts:
+- top_ingredients.png
+- prep_time_histogram.png
+- prep_vs_likes_scatter.png
 
-if used_synthetic:
-    readme.append("NOTE: Missing CSVs — synthetic fallback data used for demo charts.")
-else:
-    readme.append("Charts generated from ETL CSV files in /output/")
+User Charts:
+- users_by_country.png
+- top_users_by_interactions.png"""
 
-readme.append("")
-readme.append("Recipe Charts:")
-readme.append("- top_ingredients.png")
-readme.append("- prep_time_histogram.png")
-readme.append("- prep_vs_likes_scatter.png")
-readme.append("")
-readme.append("User Charts:")
-readme.append("- users_by_country.png")
-readme.append("- top_users_by_interactions.png")
+    (CHART_DIR / "README_charts.txt").write_text(readme_text)
 
+    print("\nAll charts saved to:", CHART_DIR)
+    print("User charts saved to:", USER_CHART_DIR)
 
-(CHART_DIR / "README_charts.txt").write_text("\n".join(readme))
 
-print("\nAll charts saved to:", CHART_DIR)
-print("User charts saved to:", USER_CHART_DIR)
+if __name__ == "__main__":
+    main()